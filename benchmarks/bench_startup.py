@@ -0,0 +1,68 @@
+"""Benchmark cold start: time from process spawn to the first `initialize` response.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10]
+
+Spawns `python -m odoo_mcp.server` (stdio mode) repeatedly, sends an MCP
+`initialize` request and measures how long the server takes to answer.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "bench-startup", "version": "0.0.0"},
+    },
+}
+
+
+def time_to_initialize() -> float:
+    """Spawn one stdio server and return seconds until the initialize response."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "odoo_mcp.server"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        proc.stdin.write(json.dumps(INITIALIZE_REQUEST) + "\n")
+        proc.stdin.flush()
+        line = proc.stdout.readline()
+        elapsed = time.perf_counter() - start
+        if not line:
+            raise RuntimeError("Server exited without answering initialize")
+        response = json.loads(line)
+        if response.get("id") != 1 or "result" not in response:
+            raise RuntimeError(f"Unexpected initialize response: {line.strip()}")
+        return elapsed
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark stdio cold start")
+    parser.add_argument("--runs", type=int, default=10, help="Number of launches")
+    args = parser.parse_args()
+
+    timings = [time_to_initialize() for _ in range(args.runs)]
+    print(f"runs:   {len(timings)}")
+    print(f"min:    {min(timings) * 1000:.1f} ms")
+    print(f"median: {statistics.median(timings) * 1000:.1f} ms")
+    print(f"max:    {max(timings) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Persistent SQLite-backed response cache shared across server processes."""
+
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    model TEXT,
+    value TEXT NOT NULL,
+    fingerprint TEXT,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+"""
+
+
+@dataclass
+class CacheEntry:
+    """A cached value with its age and staleness fingerprint.
+
+    Attributes:
+        value: Cached value
+        age: Seconds since the value was stored or last revalidated
+        fingerprint: Token to compare against the server to revalidate
+    """
+
+    value: Any
+    age: float
+    fingerprint: str | None
+
+
+class DiskCache:
+    """On-disk cache of JSON-serializable responses.
+
+    Entries are grouped by namespace (one per Odoo server, database and
+    user) and evicted least-recently-used once the total size exceeds
+    ``max_bytes``. WAL mode lets several short-lived processes share the
+    same file.
+    """
+
+    def __init__(self, path: Path, max_bytes: int):
+        """Initialize cache.
+
+        Args:
+            path: SQLite database file (parent directories are created)
+            max_bytes: Total size of stored values above which entries are evicted
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Get the SQLite connection, creating the database if needed.
+
+        The directory is created 0700 and the database 0600: cached
+        responses hold Odoo data and must stay private to the user. SQLite
+        gives its -wal/-shm files the database's permissions.
+        """
+        if self._conn is None:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            _make_private(self.path.parent, 0o700)
+            os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600))
+            for suffix in ("", "-wal", "-shm"):
+                _make_private(self.path.with_name(self.path.name + suffix), 0o600)
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(self, namespace: str, key: str) -> CacheEntry | None:
+        """Look up an entry regardless of age.
+
+        Returns:
+            The entry, or None on a miss
+        """
+        row = self.conn.execute(
+            "SELECT value, stored_at, fingerprint FROM entries WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        ).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        self.conn.execute(
+            "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+            (now, namespace, key),
+        )
+        return CacheEntry(json.loads(row[0]), now - row[1], row[2])
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        model: str | None = None,
+        fingerprint: str | None = None,
+    ) -> bool:
+        """Store a value.
+
+        Args:
+            namespace: Server/database namespace
+            key: Entry key within the namespace
+            value: JSON-serializable value
+            model: Model the value was read from, for invalidation
+            fingerprint: Token used to revalidate the entry once stale
+
+        Returns:
+            False if the value could not be serialized or is over the size limit
+        """
+        try:
+            data = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return False
+        size = len(data.encode("utf-8"))
+        if size > self.max_bytes:
+            return False
+        now = time.time()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO entries "
+            "(namespace, key, model, value, fingerprint, size, stored_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (namespace, key, model, data, fingerprint, size, now, now),
+        )
+        self._evict()
+        return True
+
+    def touch(self, namespace: str, key: str) -> None:
+        """Mark an entry as fresh again after it was revalidated."""
+        now = time.time()
+        self.conn.execute(
+            "UPDATE entries SET stored_at = ?, accessed_at = ? WHERE namespace = ? AND key = ?",
+            (now, now, namespace, key),
+        )
+
+    def invalidate(self, namespace: str, model: str | None = None) -> None:
+        """Drop entries for a namespace, or only those read from one model."""
+        if model is None:
+            self.conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+        else:
+            self.conn.execute(
+                "DELETE FROM entries WHERE namespace = ? AND model = ?",
+                (namespace, model),
+            )
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries until under the size limit."""
+        (total,) = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        freed = 0
+        victims = []
+        for namespace, key, size in self.conn.execute(
+            "SELECT namespace, key, size FROM entries ORDER BY accessed_at"
+        ):
+            victims.append((namespace, key))
+            freed += size
+            if freed >= excess:
+                break
+        self.conn.executemany(
+            "DELETE FROM entries WHERE namespace = ? AND key = ?",
+            victims,
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def _make_private(path: Path, mode: int) -> None:
+    """Drop group/other permissions from a path owned by the current user.
+
+    Tightens files and directories left by older versions, created with
+    the default umask.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return
+    owned = not hasattr(os, "getuid") or stat.st_uid == os.getuid()
+    if owned and stat.st_mode & 0o077:
+        path.chmod(mode)
@@ -0,0 +1,156 @@
+"""In-memory (id, display_name) index for fast local name lookups."""
+
+import bisect
+import heapq
+import time
+
+_SORT_CHUNK = 5000
+
+
+def _normalize(text: str) -> str:
+    return text.casefold()
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class NameIndex:
+    """Sorted prefix list and trigram index over the display names of one model.
+
+    Queries match anywhere in the name, like Odoo's ``ilike``, with names
+    starting with the query ranked first. Queries of three or more
+    characters are answered from the trigram index. Shorter ones take
+    prefix matches from the sorted list and only scan all names when there
+    are fewer prefix matches than the limit.
+    """
+
+    def __init__(self, model: str):
+        """Initialize an empty index.
+
+        Args:
+            model: Model name the index covers
+        """
+        self.model = model
+        self.names: dict[int, str] = {}
+        self.last_write_date: str | None = None
+        self.refreshed_at = 0.0
+        self.rebuilt_at = 0.0
+        self.has_active: bool | None = None
+        self._normalized: dict[int, str] = {}
+        self._trigrams: dict[str, set[int]] = {}
+        # (normalized name, id) in sort order, for prefix lookups
+        self._sorted: list[tuple[str, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def update(self, records: list[dict], sort: bool = True) -> None:
+        """Add or replace records in the index.
+
+        Records with ``active`` set to False (archived) are removed.
+
+        Args:
+            records: Records with 'id', 'display_name', 'write_date' and
+                optionally 'active'
+            sort: Keep the prefix list sorted. Pass False when loading in
+                batches and call ``sort()`` after the last one.
+        """
+        # Small batches (incremental refreshes) keep the sorted list up to
+        # date in place; large ones re-sort it once at the end
+        bulk = not sort or len(records) > len(self._sorted) // 8
+        for record in records:
+            record_id = record["id"]
+            if record_id in self.names:
+                self._remove(record_id, not bulk)
+            write_date = record.get("write_date")
+            if write_date and (self.last_write_date is None or write_date > self.last_write_date):
+                self.last_write_date = write_date
+            if record.get("active") is False:
+                continue
+            name = record.get("display_name") or ""
+            normalized = _normalize(name)
+            self.names[record_id] = name
+            self._normalized[record_id] = normalized
+            for trigram in _trigrams(normalized):
+                self._trigrams.setdefault(trigram, set()).add(record_id)
+            if not bulk:
+                bisect.insort(self._sorted, (normalized, record_id))
+        if bulk and sort:
+            self.sort()
+        self.refreshed_at = time.monotonic()
+
+    def sort(self) -> None:
+        """Rebuild the sorted prefix list from the indexed names.
+
+        Sorts in chunks and merges them, so a large index never holds the
+        GIL for one long sort when this runs in a worker thread.
+        """
+        items = [(normalized, record_id) for record_id, normalized in self._normalized.items()]
+        runs = [
+            sorted(items[start : start + _SORT_CHUNK])
+            for start in range(0, len(items), _SORT_CHUNK)
+        ]
+        self._sorted = list(heapq.merge(*runs))
+
+    def _remove(self, record_id: int, update_sorted: bool = True) -> None:
+        normalized = self._normalized.pop(record_id)
+        del self.names[record_id]
+        if update_sorted:
+            position = bisect.bisect_left(self._sorted, (normalized, record_id))
+            del self._sorted[position]
+        for trigram in _trigrams(normalized):
+            ids = self._trigrams.get(trigram)
+            if ids is not None:
+                ids.discard(record_id)
+                if not ids:
+                    del self._trigrams[trigram]
+
+    def search(self, name: str, limit: int | None = 100) -> list[list]:
+        """Find records whose display name matches.
+
+        Args:
+            name: Text to look for (case-insensitive)
+            limit: Maximum number of results (None for no limit)
+
+        Returns:
+            List of [id, display_name] pairs, like Odoo's name_search. Names
+            starting with the query come first, then alphabetical order.
+        """
+        query = _normalize(name.strip())
+        if query and len(query) < 3 and limit is not None:
+            # Prefix matches rank first, in the same order as the sorted list
+            start = bisect.bisect_left(self._sorted, (query,))
+            prefix_ids = []
+            for normalized, record_id in self._sorted[start : start + limit]:
+                if not normalized.startswith(query):
+                    break
+                prefix_ids.append(record_id)
+            if len(prefix_ids) == limit:
+                return [[record_id, self.names[record_id]] for record_id in prefix_ids]
+
+        if not query:
+            ids = list(self.names)
+        elif len(query) >= 3:
+            candidate_sets = sorted(
+                (self._trigrams.get(trigram, set()) for trigram in _trigrams(query)),
+                key=len,
+            )
+            candidates = set.intersection(*candidate_sets) if candidate_sets else set()
+            ids = [record_id for record_id in candidates if query in self._normalized[record_id]]
+        else:
+            ids = [
+                record_id
+                for record_id, normalized in self._normalized.items()
+                if query in normalized
+            ]
+
+        def sort_key(record_id: int) -> tuple:
+            normalized = self._normalized[record_id]
+            return (not normalized.startswith(query), normalized, record_id)
+
+        if limit is None:
+            ids.sort(key=sort_key)
+        else:
+            ids = heapq.nsmallest(limit, ids, key=sort_key)
+        return [[record_id, self.names[record_id]] for record_id in ids]
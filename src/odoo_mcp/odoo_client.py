@@ -1,13 +1,53 @@
 """Odoo XML-RPC Client for connecting to Odoo ERP."""
 
+import asyncio
+import logging
+import time
 import xmlrpc.client
+from collections.abc import Callable
 from typing import Any
 
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Called after each execute() with (model, method, args, kwargs, result, seconds,
+# error); error is the exception the call raised (result is then None), else None
+CallObserver = Callable[[str, str, tuple, dict, Any, float, BaseException | None], None]
+
+# Bounded waits so stalled Odoo requests can't hold the shared pool forever:
+# connecting, reading a response and waiting for a free pooled connection
+DEFAULT_TIMEOUT = httpx.Timeout(120.0, connect=10.0, pool=30.0)
+
+
+def _notify(
+    observer: CallObserver,
+    model: str,
+    method: str,
+    args: tuple,
+    kwargs: dict,
+    result: Any,
+    start: float,
+    error: BaseException | None,
+) -> None:
+    """Report a finished call to an observer; observer failures are only logged."""
+    try:
+        observer(model, method, args, kwargs, result, time.perf_counter() - start, error)
+    except Exception:
+        logger.exception("Call observer failed for %s.%s", model, method)
+
 
 class OdooClient:
     """Client for interacting with Odoo via XML-RPC API."""
 
-    def __init__(self, url: str, db: str, username: str, password: str):
+    def __init__(
+        self,
+        url: str,
+        db: str,
+        username: str,
+        password: str,
+        observer: CallObserver | None = None,
+    ):
         """Initialize Odoo client.
 
         Args:
@@ -15,11 +55,14 @@ class OdooClient:
             db: Database name
             username: Odoo username (email)
             password: Odoo password or API key
+            observer: Optional callback invoked after each execute() call,
+                including failed ones
         """
         self.url = url.rstrip("/")
         self.db = db
         self.username = username
         self.password = password
+        self.observer = observer
         self._uid: int | None = None
         self._common: xmlrpc.client.ServerProxy | None = None
         self._models: xmlrpc.client.ServerProxy | None = None
@@ -86,15 +129,26 @@ class OdooClient:
         Returns:
             Result from Odoo
         """
-        return self.models.execute_kw(
-            self.db,
-            self.uid,
-            self.password,
-            model,
-            method,
-            list(args),
-            kwargs,
-        )
+        uid = self.uid
+        start = time.perf_counter()
+        result = error = None
+        try:
+            result = self.models.execute_kw(
+                self.db,
+                uid,
+                self.password,
+                model,
+                method,
+                list(args),
+                kwargs,
+            )
+            return result
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if self.observer is not None:
+                _notify(self.observer, model, method, args, kwargs, result, start, error)
 
     def search(
         self,
@@ -194,6 +248,29 @@ class OdooClient:
         domain = domain or []
         return self.execute(model, "search_count", domain)
 
+    def name_search(
+        self,
+        model: str,
+        name: str = "",
+        domain: list | None = None,
+        operator: str = "ilike",
+        limit: int = 100,
+    ) -> list[list]:
+        """Search records by display name.
+
+        Args:
+            model: Model name
+            name: Text to match against the record name
+            domain: Additional search domain
+            operator: Operator used to match the name (e.g., 'ilike', '=')
+            limit: Maximum number of records
+
+        Returns:
+            List of [id, display_name] pairs
+        """
+        # Positional: the domain keyword is 'args' before Odoo 18, 'domain' after
+        return self.execute(model, "name_search", name, domain or [], operator, limit)
+
     def create(
         self,
         model: str,
@@ -293,3 +370,297 @@ class OdooClient:
             Version information dictionary
         """
         return self.common.version()
+
+
+class AsyncOdooClient:
+    """Async client for Odoo's XML-RPC API on top of httpx.
+
+    Mirrors the OdooClient API with coroutine methods. All calls share one
+    pooled HTTP client, so many RPCs can be in flight on a single event loop
+    without a thread per call.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        db: str,
+        username: str,
+        password: str,
+        max_connections: int = 100,
+        timeout: float | httpx.Timeout | None = DEFAULT_TIMEOUT,
+        observer: CallObserver | None = None,
+    ):
+        """Initialize async Odoo client.
+
+        Args:
+            url: Odoo server URL (e.g., https://myodoo.com)
+            db: Database name
+            username: Odoo username (email)
+            password: Odoo password or API key
+            max_connections: Maximum concurrent HTTP connections to Odoo
+            timeout: Request timeout in seconds, or an httpx.Timeout with
+                separate connect/read/write/pool limits (None for no timeout)
+            observer: Optional callback invoked after each execute() call,
+                including failed ones
+        """
+        self.url = url.rstrip("/")
+        self.db = db
+        self.username = username
+        self.password = password
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.observer = observer
+        self._uid: int | None = None
+        self._http: httpx.AsyncClient | None = None
+        self._auth_lock: asyncio.Lock | None = None
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _rpc(self, endpoint: str, method: str, *params: Any) -> Any:
+        """Call an XML-RPC method on an Odoo endpoint.
+
+        Args:
+            endpoint: Endpoint name ('common' or 'object')
+            method: Remote method name
+            *params: Method parameters
+
+        Returns:
+            Unmarshalled result
+
+        Raises:
+            xmlrpc.client.Fault: If Odoo returns a fault
+            xmlrpc.client.ProtocolError: On a non-200 HTTP response
+        """
+        url = f"{self.url}/xmlrpc/2/{endpoint}"
+        body = xmlrpc.client.dumps(params, method, allow_none=True).encode("utf-8")
+        response = await self.http.post(
+            url,
+            content=body,
+            headers={"Content-Type": "text/xml"},
+        )
+        if response.status_code != 200:
+            raise xmlrpc.client.ProtocolError(
+                url,
+                response.status_code,
+                response.reason_phrase,
+                dict(response.headers),
+            )
+        (result,), _ = xmlrpc.client.loads(response.content)
+        return result
+
+    async def authenticate(self) -> int:
+        """Authenticate with Odoo and return user ID.
+
+        Returns:
+            User ID if authentication successful
+
+        Raises:
+            Exception: If authentication fails
+        """
+        uid = await self._rpc(
+            "common", "authenticate", self.db, self.username, self.password, {}
+        )
+        if not uid:
+            raise Exception(
+                f"Authentication failed for user '{self.username}' on database '{self.db}'"
+            )
+        self._uid = uid
+        return uid
+
+    async def get_uid(self) -> int:
+        """Get authenticated user ID, authenticating if necessary.
+
+        Concurrent first calls share a single authentication round-trip.
+        """
+        if self._uid is None:
+            if self._auth_lock is None:
+                self._auth_lock = asyncio.Lock()
+            async with self._auth_lock:
+                if self._uid is None:
+                    await self.authenticate()
+        return self._uid  # type: ignore
+
+    async def execute(
+        self,
+        model: str,
+        method: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Execute a method on an Odoo model.
+
+        Args:
+            model: Model name (e.g., 'res.partner')
+            method: Method name (e.g., 'search_read')
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            Result from Odoo
+        """
+        uid = await self.get_uid()
+        start = time.perf_counter()
+        result = error = None
+        try:
+            result = await self._rpc(
+                "object",
+                "execute_kw",
+                self.db,
+                uid,
+                self.password,
+                model,
+                method,
+                list(args),
+                kwargs,
+            )
+            return result
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if self.observer is not None:
+                _notify(self.observer, model, method, args, kwargs, result, start, error)
+
+    async def search(
+        self,
+        model: str,
+        domain: list | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        order: str | None = None,
+    ) -> list[int]:
+        """Search for record IDs matching the domain. See OdooClient.search."""
+        domain = domain or []
+        kwargs: dict[str, Any] = {"offset": offset}
+        if limit is not None:
+            kwargs["limit"] = limit
+        if order is not None:
+            kwargs["order"] = order
+        return await self.execute(model, "search", domain, **kwargs)
+
+    async def read(
+        self,
+        model: str,
+        ids: list[int],
+        fields: list[str] | None = None,
+    ) -> list[dict]:
+        """Read records by IDs. See OdooClient.read."""
+        kwargs = {}
+        if fields is not None:
+            kwargs["fields"] = fields
+        return await self.execute(model, "read", ids, **kwargs)
+
+    async def search_read(
+        self,
+        model: str,
+        domain: list | None = None,
+        fields: list[str] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        order: str | None = None,
+    ) -> list[dict]:
+        """Search and read records in one call. See OdooClient.search_read."""
+        domain = domain or []
+        kwargs: dict[str, Any] = {"offset": offset}
+        if fields is not None:
+            kwargs["fields"] = fields
+        if limit is not None:
+            kwargs["limit"] = limit
+        if order is not None:
+            kwargs["order"] = order
+        return await self.execute(model, "search_read", domain, **kwargs)
+
+    async def search_count(
+        self,
+        model: str,
+        domain: list | None = None,
+    ) -> int:
+        """Count records matching the domain. See OdooClient.search_count."""
+        domain = domain or []
+        return await self.execute(model, "search_count", domain)
+
+    async def name_search(
+        self,
+        model: str,
+        name: str = "",
+        domain: list | None = None,
+        operator: str = "ilike",
+        limit: int = 100,
+    ) -> list[list]:
+        """Search records by display name. See OdooClient.name_search."""
+        return await self.execute(model, "name_search", name, domain or [], operator, limit)
+
+    async def create(
+        self,
+        model: str,
+        values: dict,
+    ) -> int:
+        """Create a new record. See OdooClient.create."""
+        return await self.execute(model, "create", values)
+
+    async def write(
+        self,
+        model: str,
+        ids: list[int],
+        values: dict,
+    ) -> bool:
+        """Update existing records. See OdooClient.write."""
+        return await self.execute(model, "write", ids, values)
+
+    async def unlink(
+        self,
+        model: str,
+        ids: list[int],
+    ) -> bool:
+        """Delete records. See OdooClient.unlink."""
+        return await self.execute(model, "unlink", ids)
+
+    async def fields_get(
+        self,
+        model: str,
+        attributes: list[str] | None = None,
+    ) -> dict:
+        """Get field definitions for a model. See OdooClient.fields_get."""
+        kwargs = {}
+        if attributes is not None:
+            kwargs["attributes"] = attributes
+        return await self.execute(model, "fields_get", **kwargs)
+
+    async def check_access_rights(
+        self,
+        model: str,
+        operation: str,
+        raise_exception: bool = False,
+    ) -> bool:
+        """Check access rights for an operation. See OdooClient.check_access_rights."""
+        return await self.execute(
+            model,
+            "check_access_rights",
+            operation,
+            raise_exception=raise_exception,
+        )
+
+    async def get_version(self) -> dict:
+        """Get Odoo server version info.
+
+        Returns:
+            Version information dictionary
+        """
+        return await self._rpc("common", "version")
@@ -0,0 +1,300 @@
+"""Slow-call log and per-query profiling for Odoo RPC calls."""
+
+import collections
+import contextlib
+import contextvars
+import json
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Methods whose first positional argument is a search domain
+_DOMAIN_METHODS = frozenset({"search", "search_read", "search_count", "read_group"})
+
+_DOMAIN_OPERATORS = frozenset({"&", "|", "!"})
+
+# Methods that read all fields when no field list is given
+_READ_METHODS = frozenset({"read", "search_read"})
+
+# Calls made during the current tool call, awaiting format time and size
+_pending_calls: contextvars.ContextVar[list["CallRecord"] | None] = contextvars.ContextVar(
+    "odoo_mcp_pending_calls", default=None
+)
+
+
+def normalize_domain(domain: Any) -> str | None:
+    """Replace the values in a domain with '?' so similar queries group together.
+
+    Example: [['name', 'ilike', 'acme']] -> '[["name","ilike","?"]]'
+    """
+    if not isinstance(domain, (list, tuple)):
+        return None
+    normalized: list[Any] = []
+    for term in domain:
+        if isinstance(term, (list, tuple)) and len(term) == 3:
+            normalized.append([term[0], term[1], "?"])
+        elif isinstance(term, str) and term in _DOMAIN_OPERATORS:
+            normalized.append(term)
+        else:
+            normalized.append("?")
+    return json.dumps(normalized, separators=(",", ":"))
+
+
+@dataclass
+class CallRecord:
+    """One profiled Odoo RPC call.
+
+    Attributes:
+        server: Server name from config
+        model: Model name
+        method: Method name
+        domain: Normalized search domain, if the method takes one
+        fields: Requested fields (None when all fields were read)
+        rows: Number of records returned, for list results
+        bytes: Size of the tool output built from this call
+        rpc_seconds: Time spent in the RPC
+        format_seconds: Time spent formatting the tool output
+        tool: Tool that made the call
+        error: Exception type name if the call failed or was cancelled
+        timestamp: Unix time the call finished
+    """
+
+    server: str | None
+    model: str
+    method: str
+    domain: str | None
+    fields: list[str] | None
+    rows: int | None
+    bytes: int | None
+    rpc_seconds: float
+    format_seconds: float = 0.0
+    tool: str | None = None
+    error: str | None = None
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def total_seconds(self) -> float:
+        return self.rpc_seconds + self.format_seconds
+
+
+class SlowCallLog:
+    """Bounded log of calls slower than a threshold, with aggregate reports."""
+
+    def __init__(
+        self,
+        threshold: float,
+        max_entries: int = 1000,
+        path: Path | None = None,
+    ):
+        """Initialize slow-call log.
+
+        Args:
+            threshold: Seconds (RPC + formatting) above which a call is logged
+            max_entries: Number of most recent slow calls kept in memory
+            path: Optional file to append slow calls to as NDJSON
+        """
+        self.threshold = threshold
+        self.path = path
+        self.entries: collections.deque[CallRecord] = collections.deque(maxlen=max_entries)
+
+    def observe(
+        self,
+        server: str | None,
+        model: str,
+        method: str,
+        args: tuple,
+        kwargs: dict,
+        result: Any,
+        seconds: float,
+        error: BaseException | None = None,
+    ) -> None:
+        """Record a finished RPC, successful or not.
+
+        Bind ``server`` with functools.partial to use this as a client
+        observer. Inside a tool call (see ``collect_calls``) the record is held back
+        until formatting is done; otherwise it is logged right away.
+        """
+        if method in _DOMAIN_METHODS:
+            domain = args[0] if args else kwargs.get("domain")
+        elif method == "name_search":
+            domain = args[1] if len(args) > 1 else None
+        else:
+            domain = None
+        record = CallRecord(
+            server=server,
+            model=model,
+            method=method,
+            domain=normalize_domain(domain),
+            fields=kwargs.get("fields"),
+            rows=len(result) if isinstance(result, list) else None,
+            bytes=None,
+            rpc_seconds=seconds,
+            error=None if error is None else type(error).__name__,
+        )
+        pending = _pending_calls.get()
+        if pending is not None:
+            pending.append(record)
+        else:
+            self.add(record)
+
+    def add(self, record: CallRecord) -> None:
+        """Log a record if it is over the threshold."""
+        if record.total_seconds < self.threshold:
+            return
+        self.entries.append(record)
+        if self.path is not None:
+            try:
+                with open(self.path, "a") as f:
+                    f.write(json.dumps(asdict(record), default=str) + "\n")
+            except OSError as e:
+                logger.warning("Cannot write slow-call log %s: %s", self.path, e)
+
+    def finish(
+        self,
+        calls: list[CallRecord],
+        tool: str,
+        format_seconds: float = 0.0,
+        size: int | None = None,
+    ) -> None:
+        """Log the calls collected during a tool call.
+
+        Formatting time and output size are attributed to the last call,
+        whose result the tool returned.
+        """
+        if calls:
+            calls[-1].format_seconds = format_seconds
+            calls[-1].bytes = size
+        for record in calls:
+            record.tool = tool
+            self.add(record)
+
+    def records(self) -> Iterable[CallRecord]:
+        """Slow calls to report on.
+
+        With a log file these are read back from it, so calls logged by
+        earlier (e.g. short-lived stdio) processes are included; otherwise
+        the in-memory entries are used.
+        """
+        if self.path is None:
+            return self.entries
+        return self._read_file(self.path)
+
+    def _read_file(self, path: Path) -> Iterator[CallRecord]:
+        try:
+            f = open(path)
+        except OSError as e:
+            # Nothing on disk (e.g. writes failed too): report what this process saw
+            if not isinstance(e, FileNotFoundError):
+                logger.warning("Cannot read slow-call log %s: %s", path, e)
+            yield from self.entries
+            return
+        with f:
+            yield from _parse_records(f)
+
+    def report(self, limit: int = 10, sort_by: str = "total") -> dict:
+        """Aggregate slow calls by server, model, method, domain shape and fields.
+
+        Args:
+            limit: Number of groups to return
+            sort_by: 'total' (summed time), 'max' (worst call) or 'count'
+
+        Returns:
+            Report with the top groups and overall counts
+        """
+        groups: dict[tuple, dict] = {}
+        slow_calls = 0
+        for record in self.records():
+            slow_calls += 1
+            fields = None if record.fields is None else sorted(record.fields)
+            key = (record.server, record.model, record.method, record.domain, json.dumps(fields))
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = {
+                    "server": record.server,
+                    "model": record.model,
+                    "method": record.method,
+                    "domain": record.domain,
+                    "fields": "all"
+                    if fields is None and record.method in _READ_METHODS
+                    else fields,
+                    "count": 0,
+                    "errors": 0,
+                    "total_seconds": 0.0,
+                    "max_seconds": 0.0,
+                    "rpc_seconds": 0.0,
+                    "format_seconds": 0.0,
+                    "rows": 0,
+                    "bytes": 0,
+                    "tools": set(),
+                }
+            group["count"] += 1
+            if record.error:
+                group["errors"] += 1
+            group["total_seconds"] += record.total_seconds
+            group["max_seconds"] = max(group["max_seconds"], record.total_seconds)
+            group["rpc_seconds"] += record.rpc_seconds
+            group["format_seconds"] += record.format_seconds
+            group["rows"] += record.rows or 0
+            group["bytes"] += record.bytes or 0
+            if record.tool:
+                group["tools"].add(record.tool)
+
+        sort_keys = {
+            "total": lambda g: g["total_seconds"],
+            "max": lambda g: g["max_seconds"],
+            "count": lambda g: g["count"],
+        }
+        if sort_by not in sort_keys:
+            raise ValueError(f"sort_by must be one of: {', '.join(sort_keys)}")
+        top = sorted(groups.values(), key=sort_keys[sort_by], reverse=True)[:limit]
+        for group in top:
+            group["avg_seconds"] = group["total_seconds"] / group["count"]
+            group["tools"] = sorted(group["tools"])
+            for key in group:
+                if key.endswith("_seconds"):
+                    group[key] = round(group[key], 4)
+
+        return {
+            "threshold_seconds": self.threshold,
+            "slow_calls": slow_calls,
+            "groups": len(groups),
+            "top": top,
+        }
+
+    def clear(self) -> None:
+        """Drop all logged calls, including the log file's contents."""
+        self.entries.clear()
+        if self.path is not None:
+            try:
+                open(self.path, "w").close()
+            except OSError as e:
+                logger.warning("Cannot clear slow-call log %s: %s", self.path, e)
+
+
+_RECORD_FIELDS = frozenset(f.name for f in fields(CallRecord))
+
+
+def _parse_records(lines: Iterable[str]) -> Iterator[CallRecord]:
+    """Parse NDJSON slow-call log lines, skipping partial or malformed ones."""
+    for line in lines:
+        try:
+            data = json.loads(line)
+            yield CallRecord(**{key: value for key, value in data.items() if key in _RECORD_FIELDS})
+        except (ValueError, TypeError, AttributeError):
+            continue
+
+
+@contextlib.contextmanager
+def collect_calls() -> Iterator[list[CallRecord]]:
+    """Collect calls observed in this context instead of logging them directly."""
+    calls: list[CallRecord] = []
+    token = _pending_calls.set(calls)
+    try:
+        yield calls
+    finally:
+        _pending_calls.reset(token)
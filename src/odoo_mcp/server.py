@@ -1,48 +1,178 @@
 """Odoo MCP Server - Main server implementation with multi-server support."""
 
 import argparse
+import asyncio
+import functools
+import http.client
+import inspect
 import json
+import logging
 import os
+import sqlite3
+import time
+import weakref
+import xmlrpc.client
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from dotenv import load_dotenv
+import httpx
+from jsonschema import Draft202012Validator
 from mcp.server import Server
-from mcp.server.stdio import stdio_server
-from mcp.types import TextContent, Tool
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.types import Resource, ResourceLink, TextContent, Tool, ToolAnnotations
+from pydantic import AnyUrl
 
-from .odoo_client import OdooClient
+from .disk_cache import DiskCache
+from .name_index import NameIndex
+from .odoo_client import DEFAULT_TIMEOUT, AsyncOdooClient, OdooClient
+from .profiling import SlowCallLog, collect_calls
+from .spool import NDJSON_MIME_TYPE, ResultSpool
 
-# Load environment variables
-load_dotenv()
+logger = logging.getLogger(__name__)
 
 # Initialize server
 server = Server("odoo-mcp")
 
+# Tool definitions are static; built on first list_tools call and reused
+_tools: list[Tool] | None = None
+
+# Whether .env has been loaded (deferred until config is first needed)
+_env_loaded = False
+
 # Client pool for multiple Odoo servers
-_clients: dict[str, OdooClient] = {}
+_clients: dict[str, OdooClient | AsyncOdooClient] = {}
+
+# Hand out AsyncOdooClient instead of OdooClient (set in HTTP mode)
+_use_async_client = False
 _server_configs: dict[str, dict] = {}
 _default_server: str | None = None
 
+# Spool for results too large to return inline (None when disabled)
+_spool: ResultSpool | None = None
+_spool_configured = False
 
-def load_server_configs() -> None:
-    """Load server configurations from JSON file or environment variables."""
-    global _server_configs, _default_server
+# Persistent response cache, used in stdio mode (configured on first use)
+_disk_cache: DiskCache | None = None
+_disk_cache_enabled = False
+_disk_cache_configured = False
+_cache_models: frozenset[str] = frozenset()
+_cache_ttl = 86400.0
+_cache_data_ttl = 3600.0
 
-    # Try to load from JSON config file
+# Log of slow Odoo calls (configured on first use)
+_slow_log: SlowCallLog | None = None
+
+# Local name indexes per client and model; weak keys so an index goes away
+# with its client when a config reload rebuilds it
+_name_indexes: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_name_index_models: frozenset[str] | None = None
+_name_index_refresh = 30.0
+_name_index_rebuild = 3600.0
+_NAME_INDEX_PAGE_SIZE = 5000
+
+# Config file watch state (hot reload)
+_config_path: Path | None = None
+_config_mtime: float | None = None
+_config_checked_at: float = 0.0
+_config_reload_interval: float | None = None
+
+
+def _load_env() -> None:
+    """Load environment variables from .env once, on first use."""
+    global _env_loaded, _config_reload_interval
+
+    if _env_loaded:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _config_reload_interval = float(os.getenv("ODOO_CONFIG_RELOAD_INTERVAL", "2"))
+    _env_loaded = True
+
+
+def _find_config_file() -> Path | None:
+    """Return the first existing JSON config file, if any."""
     config_paths = [
         Path(os.getenv("ODOO_CONFIG_FILE", "")),
         Path.cwd() / "odoo_servers.json",
         Path(__file__).parent.parent.parent.parent / "odoo_servers.json",
     ]
-
     for config_path in config_paths:
         if config_path.is_file():
-            with open(config_path) as f:
-                config = json.load(f)
-                _server_configs = config.get("servers", {})
-                _default_server = config.get("default_server")
-                return
+            return config_path
+    return None
+
+
+_REQUIRED_SERVER_KEYS = ("url", "db", "username", "password")
+
+
+def _parse_config_file(config: Any) -> tuple[dict[str, dict], str | None]:
+    """Validate the contents of a JSON config file.
+
+    Returns:
+        Server configs by name and the default server name
+
+    Raises:
+        ValueError: If the config does not have the expected shape
+    """
+    if not isinstance(config, dict):
+        raise ValueError("Config file must contain a JSON object")
+    servers = config.get("servers", {})
+    if not isinstance(servers, dict):
+        raise ValueError("'servers' must be an object of server configs")
+    for name, server_config in servers.items():
+        if not isinstance(server_config, dict):
+            raise ValueError(f"Server '{name}' config must be an object")
+        missing = [key for key in _REQUIRED_SERVER_KEYS if not server_config.get(key)]
+        if missing:
+            raise ValueError(f"Server '{name}' is missing: {', '.join(missing)}")
+    return servers, config.get("default_server")
+
+
+def _apply_server_configs(configs: dict[str, dict], default_server: str | None) -> None:
+    """Swap in a new set of server configs.
+
+    Clients whose config is unchanged are kept (with their live connections);
+    clients for removed or modified servers are dropped and rebuilt lazily.
+    """
+    global _clients, _server_configs, _default_server
+
+    # Dropped clients are not closed explicitly: in-flight tool calls may
+    # still be using them. Their connections go away when they are collected.
+    clients = {
+        name: client
+        for name, client in _clients.items()
+        if configs.get(name) == _server_configs.get(name)
+    }
+
+    # Rebind all globals together so readers never see a half-applied config
+    _server_configs, _default_server, _clients = configs, default_server, clients
+
+
+def load_server_configs() -> None:
+    """Load server configurations from JSON file or environment variables.
+
+    Raises:
+        ValueError: If the config file is not valid JSON or has the wrong shape
+    """
+    global _config_path, _config_mtime, _config_checked_at
+
+    _load_env()
+    _config_checked_at = time.monotonic()
+
+    # Try to load from JSON config file
+    config_path = _find_config_file()
+    if config_path is not None:
+        mtime = config_path.stat().st_mtime
+        with open(config_path) as f:
+            servers, default_server = _parse_config_file(json.load(f))
+        _apply_server_configs(servers, default_server)
+        _config_path, _config_mtime = config_path, mtime
+        return
+
+    _config_path, _config_mtime = None, None
 
     # Fallback to environment variables (single server, backward compatible)
     url = os.getenv("ODOO_URL")
@@ -51,35 +181,95 @@ def load_server_configs() -> None:
     password = os.getenv("ODOO_PASSWORD")
 
     if all([url, db, username, password]):
-        _server_configs["default"] = {
-            "url": url,
-            "db": db,
-            "username": username,
-            "password": password,
-        }
-        _default_server = "default"
+        _apply_server_configs(
+            {
+                "default": {
+                    "url": url,
+                    "db": db,
+                    "username": username,
+                    "password": password,
+                }
+            },
+            "default",
+        )
+
+
+def reload_server_configs_if_changed() -> bool:
+    """Reload the config file if it changed on disk since the last load.
+
+    The file is stat'ed at most once every ``ODOO_CONFIG_RELOAD_INTERVAL`` seconds.
+    A config that fails to parse or has the wrong shape is ignored and the
+    previous one stays active.
+
+    Returns:
+        True if a new configuration was applied.
+    """
+    global _config_checked_at
+
+    _load_env()
+    now = time.monotonic()
+    if now - _config_checked_at < (_config_reload_interval or 0.0):
+        return False
+    _config_checked_at = now
+
+    config_path = _find_config_file()
+    if config_path is None and _config_path is None:
+        return False
+    try:
+        mtime = config_path.stat().st_mtime if config_path is not None else None
+    except OSError:
+        return False
+    if config_path == _config_path and mtime == _config_mtime:
+        return False
+
+    try:
+        load_server_configs()
+    except (OSError, ValueError):
+        # Partially written, invalid or malformed file: keep serving the old config
+        return False
+    return True
+
+
+def _async_client_options() -> dict[str, Any]:
+    """HTTP pool settings for AsyncOdooClient.
+
+    Configured by ODOO_HTTP_MAX_CONNECTIONS (per server), ODOO_HTTP_TIMEOUT
+    (read/write, seconds), ODOO_HTTP_CONNECT_TIMEOUT and ODOO_HTTP_POOL_TIMEOUT
+    (waiting for a free connection, seconds).
+    """
+    _load_env()
+    return {
+        "max_connections": int(os.getenv("ODOO_HTTP_MAX_CONNECTIONS", "100")),
+        "timeout": httpx.Timeout(
+            float(os.getenv("ODOO_HTTP_TIMEOUT", str(DEFAULT_TIMEOUT.read))),
+            connect=float(os.getenv("ODOO_HTTP_CONNECT_TIMEOUT", str(DEFAULT_TIMEOUT.connect))),
+            pool=float(os.getenv("ODOO_HTTP_POOL_TIMEOUT", str(DEFAULT_TIMEOUT.pool))),
+        ),
+    }
 
 
 def get_server_names() -> list[str]:
     """Get list of configured server names."""
     if not _server_configs:
         load_server_configs()
+    else:
+        reload_server_configs_if_changed()
     return list(_server_configs.keys())
 
 
-def get_client(server_name: str | None = None) -> OdooClient:
+def get_client(server_name: str | None = None) -> OdooClient | AsyncOdooClient:
     """Get or create Odoo client instance for specified server.
 
     Args:
         server_name: Name of server from config. None uses default server.
 
     Returns:
-        OdooClient instance for the specified server.
+        AsyncOdooClient in HTTP mode, otherwise OdooClient, for the specified server.
     """
-    global _clients
-
     if not _server_configs:
         load_server_configs()
+    else:
+        reload_server_configs_if_changed()
 
     if not _server_configs:
         raise ValueError(
@@ -100,16 +290,365 @@ def get_client(server_name: str | None = None) -> OdooClient:
     # Return cached client or create new one
     if server_name not in _clients:
         config = _server_configs[server_name]
-        _clients[server_name] = OdooClient(
+        client_class = AsyncOdooClient if _use_async_client else OdooClient
+        options = _async_client_options() if _use_async_client else {}
+        _clients[server_name] = client_class(
             url=config["url"],
             db=config["db"],
             username=config["username"],
             password=config["password"],
+            observer=functools.partial(get_slow_log().observe, server_name),
+            **options,
         )
 
     return _clients[server_name]
 
 
+def get_disk_cache() -> DiskCache | None:
+    """Get the persistent response cache, or None if it is not in use.
+
+    Only enabled in stdio mode, where each session is a new short-lived
+    process. Configured by ODOO_DISK_CACHE (0 disables), ODOO_CACHE_DIR,
+    ODOO_CACHE_MAX_MB, ODOO_CACHE_TTL (version, seconds), ODOO_CACHE_DATA_TTL
+    (fields_get and reference data, revalidated once stale, seconds) and
+    ODOO_CACHE_MODELS (comma-separated reference data models). Only list
+    models whose stored fields are what gets read: revalidation can't see
+    computed values that depend on other models or the date, such as
+    res.currency rates.
+    """
+    global _disk_cache, _disk_cache_configured, _cache_models, _cache_ttl, _cache_data_ttl
+
+    if not _disk_cache_enabled:
+        return None
+    if not _disk_cache_configured:
+        _load_env()
+        if os.getenv("ODOO_DISK_CACHE", "1") != "0":
+            cache_dir = Path(os.getenv("ODOO_CACHE_DIR") or _user_cache_dir())
+            _disk_cache = DiskCache(
+                path=cache_dir / "responses.sqlite3",
+                max_bytes=int(float(os.getenv("ODOO_CACHE_MAX_MB", "64")) * 1024 * 1024),
+            )
+            _cache_models = frozenset(
+                name.strip()
+                for name in os.getenv(
+                    "ODOO_CACHE_MODELS",
+                    "res.country,res.country.state,res.lang,uom.uom,uom.category",
+                ).split(",")
+                if name.strip()
+            )
+            _cache_ttl = float(os.getenv("ODOO_CACHE_TTL", "86400"))
+            _cache_data_ttl = float(os.getenv("ODOO_CACHE_DATA_TTL", "3600"))
+        _disk_cache_configured = True
+    return _disk_cache
+
+
+def _disable_disk_cache(error: Exception) -> None:
+    """Stop using the persistent cache after it failed, e.g. an unwritable directory."""
+    global _disk_cache
+
+    if _disk_cache is not None:
+        logger.warning("Disabling response cache %s: %s", _disk_cache.path, error)
+        try:
+            _disk_cache.close()
+        except sqlite3.Error:
+            pass
+        _disk_cache = None
+
+
+def _is_reference_model(model: str) -> bool:
+    """Whether reads from a model are kept in the persistent cache."""
+    return get_disk_cache() is not None and model in _cache_models
+
+
+def _cache_namespace(client: OdooClient | AsyncOdooClient) -> str:
+    """Cache namespace for a client: server URL, database and user."""
+    return f"{client.url}|{client.db}|{client.username}"
+
+
+async def _data_fingerprint(
+    client: OdooClient | AsyncOdooClient,
+    model: str,
+    domain: list | None = None,
+) -> str:
+    """Cheap token that changes when records of a model are added, removed or edited."""
+    domain = domain or []
+    count = await _resolve(client.search_count(model, domain))
+    latest = await _resolve(
+        client.search_read(model, domain, ["write_date"], limit=1, order="write_date desc")
+    )
+    return f"{count}:{latest[0]['write_date'] if latest else ''}"
+
+
+async def _cached(
+    client: OdooClient | AsyncOdooClient,
+    key: list,
+    fetch: Callable[[], Any],
+    model: str | None = None,
+    fingerprint: Callable[[], Awaitable[str]] | None = None,
+) -> Any:
+    """Return a response from the persistent cache, fetching it on a miss.
+
+    Entries older than their TTL are fetched again, except those with a
+    fingerprint (reference data, or an explicit ``fingerprint``), which are
+    first revalidated against it. The fingerprint is only taken once an
+    entry is stale, so a cold miss costs a single RPC; entries stored
+    without one are refetched on their first revalidation. Cache errors
+    disable the cache and fall back to the RPC.
+
+    Args:
+        client: Client the response comes from
+        key: JSON-serializable cache key within the client's namespace
+        fetch: Callable performing the RPC
+        model: Reference data model, for fingerprinting and invalidation
+        fingerprint: Callable returning a staleness token; defaults to the
+            record count and latest write_date of ``model``
+    """
+    cache = get_disk_cache()
+    if cache is None:
+        return await _resolve(fetch())
+
+    if fingerprint is None and model is not None:
+        fingerprint = functools.partial(_data_fingerprint, client, model)
+    namespace = _cache_namespace(client)
+    cache_key = json.dumps(key, separators=(",", ":"), default=str)
+    ttl = _cache_ttl if fingerprint is None else _cache_data_ttl
+    try:
+        entry = cache.get(namespace, cache_key)
+    except (sqlite3.Error, OSError) as e:
+        _disable_disk_cache(e)
+        return await _resolve(fetch())
+    if entry is not None and entry.age < ttl:
+        return entry.value
+
+    token = None
+    if fingerprint is not None and entry is not None:
+        try:
+            token = await fingerprint()
+        except xmlrpc.client.Fault:
+            # E.g. no read access to the fingerprinted model: refetch, TTL only
+            pass
+        if token is not None and entry.fingerprint == token:
+            try:
+                cache.touch(namespace, cache_key)
+            except (sqlite3.Error, OSError) as e:
+                _disable_disk_cache(e)
+            return entry.value
+
+    value = await _resolve(fetch())
+    try:
+        cache.set(namespace, cache_key, value, model=model, fingerprint=token)
+    except (sqlite3.Error, OSError) as e:
+        _disable_disk_cache(e)
+    return value
+
+
+def get_slow_log() -> SlowCallLog:
+    """Get the slow-call log.
+
+    Configured by ODOO_SLOW_CALL_MS (threshold, default 1000), ODOO_SLOW_LOG_SIZE
+    (entries kept in memory) and ODOO_SLOW_LOG_FILE (optional NDJSON file).
+    """
+    global _slow_log
+
+    if _slow_log is None:
+        _load_env()
+        log_file = os.getenv("ODOO_SLOW_LOG_FILE")
+        _slow_log = SlowCallLog(
+            threshold=float(os.getenv("ODOO_SLOW_CALL_MS", "1000")) / 1000,
+            max_entries=int(os.getenv("ODOO_SLOW_LOG_SIZE", "1000")),
+            path=Path(log_file) if log_file else None,
+        )
+    return _slow_log
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache directory (XDG_CACHE_HOME or ~/.cache) for this server."""
+    return Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "odoo-mcp"
+
+
+def get_spool() -> ResultSpool | None:
+    """Get the result spool, or None if spilling is disabled.
+
+    Configured by ODOO_SPILL_THRESHOLD_BYTES (0 disables), ODOO_SPOOL_DIR
+    and ODOO_SPOOL_TTL (seconds). The default directory is per user, under
+    XDG_RUNTIME_DIR if set, otherwise the user cache directory.
+    """
+    global _spool, _spool_configured
+
+    if not _spool_configured:
+        _load_env()
+        threshold = int(os.getenv("ODOO_SPILL_THRESHOLD_BYTES", str(1024 * 1024)))
+        if threshold > 0:
+            runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+            if os.getenv("ODOO_SPOOL_DIR"):
+                directory = Path(os.environ["ODOO_SPOOL_DIR"])
+            elif runtime_dir:
+                directory = Path(runtime_dir) / "odoo-mcp-spool"
+            else:
+                directory = _user_cache_dir() / "spool"
+            _spool = ResultSpool(
+                directory=directory,
+                threshold=threshold,
+                ttl=float(os.getenv("ODOO_SPOOL_TTL", "3600")),
+            )
+        _spool_configured = True
+    return _spool
+
+
+def _name_index_enabled(model: str) -> bool:
+    """Whether name lookups on a model are served from a local index.
+
+    Configured by ODOO_NAME_INDEX_MODELS (comma-separated, empty disables),
+    ODOO_NAME_INDEX_REFRESH (seconds between incremental refreshes) and
+    ODOO_NAME_INDEX_REBUILD (seconds between full reloads, which also drop
+    deleted records).
+    """
+    global _name_index_models, _name_index_refresh, _name_index_rebuild
+
+    if _name_index_models is None:
+        _load_env()
+        _name_index_models = frozenset(
+            name.strip()
+            for name in os.getenv("ODOO_NAME_INDEX_MODELS", "").split(",")
+            if name.strip()
+        )
+        _name_index_refresh = float(os.getenv("ODOO_NAME_INDEX_REFRESH", "30"))
+        _name_index_rebuild = float(os.getenv("ODOO_NAME_INDEX_REBUILD", "3600"))
+    return model in _name_index_models
+
+
+async def _load_name_index(
+    client: OdooClient | AsyncOdooClient,
+    model: str,
+    fields: list[str],
+) -> NameIndex:
+    """Build a new name index from every active record.
+
+    Records are fetched in pages by ascending id and indexed in a worker
+    thread, so a large model does not stall the event loop.
+    """
+    index = NameIndex(model)
+    last_id = 0
+    while True:
+        page = await _resolve(
+            client.search_read(
+                model,
+                [["id", ">", last_id]],
+                fields,
+                limit=_NAME_INDEX_PAGE_SIZE,
+                order="id",
+            )
+        )
+        if page:
+            await asyncio.to_thread(index.update, page, False)
+            last_id = page[-1]["id"]
+        if len(page) < _NAME_INDEX_PAGE_SIZE:
+            break
+    await asyncio.to_thread(index.sort)
+    index.rebuilt_at = index.refreshed_at = time.monotonic()
+    return index
+
+
+async def get_name_index(client: OdooClient | AsyncOdooClient, model: str) -> NameIndex:
+    """Get the name index for a model, loading or refreshing it if stale.
+
+    A full load fetches (id, display_name, write_date) for every active
+    record into a new index that replaces the old one when complete; until
+    then other lookups keep using the old index. Refreshes only fetch
+    records written since the newest write_date seen, including archived
+    ones (active_test off) so they can be dropped.
+    """
+    indexes = _name_indexes.setdefault(client, {})
+    if model not in indexes:
+        indexes[model] = (NameIndex(model), asyncio.Lock())
+    index, lock = indexes[model]
+    if lock.locked() and index.rebuilt_at:
+        # Another lookup is refreshing it: serve the current contents
+        return index
+
+    fields = ["display_name", "write_date"]
+    async with lock:
+        index = indexes[model][0]
+        if index.has_active is None:
+            model_fields = await _resolve(client.fields_get(model, attributes=["type"]))
+            index.has_active = "active" in model_fields
+        now = time.monotonic()
+        if not index.rebuilt_at or now - index.rebuilt_at > _name_index_rebuild:
+            invalidated = (index.refreshed_at, index.rebuilt_at)
+            new_index = await _load_name_index(client, model, fields)
+            new_index.has_active = index.has_active
+            # Writes invalidated the old index during the load: the new one
+            # may predate them too
+            if index.refreshed_at != invalidated[0]:
+                new_index.refreshed_at = 0.0
+            if index.rebuilt_at != invalidated[1]:
+                new_index.rebuilt_at = 0.0
+            indexes[model] = (new_index, lock)
+            index = new_index
+        elif now - index.refreshed_at > _name_index_refresh:
+            domain = [["write_date", ">=", index.last_write_date]] if index.last_write_date else []
+            if index.has_active:
+                records = client.execute(
+                    model,
+                    "search_read",
+                    domain,
+                    fields=fields + ["active"],
+                    context={"active_test": False},
+                )
+            else:
+                records = client.search_read(model, domain, fields)
+            index.update(await _resolve(records))
+    return index
+
+
+def _invalidate_caches(
+    client: OdooClient | AsyncOdooClient,
+    model: str,
+    deleted: bool = False,
+) -> None:
+    """Drop cached data for a model after it was modified through a tool.
+
+    Persistent cache entries are deleted; the name index is refreshed (or,
+    after deletes, fully reloaded) on next lookup.
+    """
+    if _is_reference_model(model):
+        try:
+            get_disk_cache().invalidate(_cache_namespace(client), model)  # type: ignore[union-attr]
+        except (sqlite3.Error, OSError) as e:
+            _disable_disk_cache(e)
+
+    entry = _name_indexes.get(client, {}).get(model)
+    if entry is not None:
+        index = entry[0]
+        index.refreshed_at = 0.0
+        if deleted:
+            index.rebuilt_at = 0.0
+
+
+def _invalidate_after_write(name: str, arguments: dict) -> None:
+    """Invalidate caches for the model a mutating tool call targeted."""
+    try:
+        client = get_client(arguments.get("server"))
+    except ValueError:
+        return
+    deleted = name == "odoo_delete" or arguments.get("method") == "unlink"
+    _invalidate_caches(client, arguments["model"], deleted=deleted)
+
+
+async def close_clients() -> None:
+    """Close connections held by async clients."""
+    for client in list(_clients.values()):
+        if isinstance(client, AsyncOdooClient):
+            await client.aclose()
+
+
+async def _resolve(result: Any) -> Any:
+    """Await a client result if it came from AsyncOdooClient."""
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
 def format_result(result: Any) -> str:
     """Format result for MCP response."""
     if isinstance(result, (dict, list)):
@@ -125,347 +664,673 @@ def _server_property() -> dict:
     }
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available Odoo tools."""
-    return [
-        Tool(
-            name="odoo_list_servers",
-            description="List all configured Odoo servers.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
-        ),
-        Tool(
-            name="odoo_search_read",
-            description="Search and read records from an Odoo model. "
-            "Returns records matching the search domain with specified fields.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "server": _server_property(),
-                    "model": {
-                        "type": "string",
-                        "description": "Odoo model name (e.g., 'res.partner', 'sale.order')",
-                    },
-                    "domain": {
-                        "type": "array",
-                        "items": {"type": "array", "items": {}},
-                        "description": "Search domain as list of conditions. "
-                        "Example: [['is_company', '=', True], ['country_id.code', '=', 'TH']]",
-                        "default": [],
-                    },
-                    "fields": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of field names to return. Empty for all fields.",
-                    },
-                    "offset": {
-                        "type": "integer",
-                        "description": "Number of records to skip",
-                        "default": 0,
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of records to return",
-                    },
-                    "order": {
-                        "type": "string",
-                        "description": "Sort order (e.g., 'name asc, id desc')",
-                    },
-                },
-                "required": ["model"],
-            },
-        ),
-        Tool(
-            name="odoo_search_count",
-            description="Count records matching a search domain in an Odoo model.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "server": _server_property(),
-                    "model": {
-                        "type": "string",
-                        "description": "Odoo model name",
-                    },
-                    "domain": {
-                        "type": "array",
-                        "items": {"type": "array", "items": {}},
-                        "description": "Search domain as list of conditions",
-                        "default": [],
-                    },
-                },
-                "required": ["model"],
-            },
-        ),
-        Tool(
-            name="odoo_read",
-            description="Read specific records by their IDs from an Odoo model.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "server": _server_property(),
-                    "model": {
-                        "type": "string",
-                        "description": "Odoo model name",
-                    },
-                    "ids": {
-                        "type": "array",
-                        "items": {"type": "integer"},
-                        "description": "List of record IDs to read",
-                    },
-                    "fields": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of field names to return",
-                    },
-                },
-                "required": ["model", "ids"],
-            },
-        ),
-        Tool(
-            name="odoo_create",
-            description="Create a new record in an Odoo model.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "server": _server_property(),
-                    "model": {
-                        "type": "string",
-                        "description": "Odoo model name",
-                    },
-                    "values": {
-                        "type": "object",
-                        "description": "Field values for the new record. "
-                        "Example: {'name': 'New Partner', 'email': 'partner@example.com'}",
-                    },
-                },
-                "required": ["model", "values"],
-            },
-        ),
-        Tool(
-            name="odoo_write",
-            description="Update existing records in an Odoo model.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "server": _server_property(),
-                    "model": {
-                        "type": "string",
-                        "description": "Odoo model name",
-                    },
-                    "ids": {
-                        "type": "array",
-                        "items": {"type": "integer"},
-                        "description": "List of record IDs to update",
-                    },
-                    "values": {
-                        "type": "object",
-                        "description": "Field values to update",
-                    },
-                },
-                "required": ["model", "ids", "values"],
-            },
-        ),
-        Tool(
-            name="odoo_delete",
-            description="Delete records from an Odoo model.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "server": _server_property(),
-                    "model": {
-                        "type": "string",
-                        "description": "Odoo model name",
-                    },
-                    "ids": {
-                        "type": "array",
-                        "items": {"type": "integer"},
-                        "description": "List of record IDs to delete",
-                    },
-                },
-                "required": ["model", "ids"],
-            },
-        ),
-        Tool(
-            name="odoo_execute",
-            description="Execute any method on an Odoo model. "
-            "Use this for custom methods or operations not covered by other tools.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "server": _server_property(),
-                    "model": {
-                        "type": "string",
-                        "description": "Odoo model name",
-                    },
-                    "method": {
-                        "type": "string",
-                        "description": "Method name to call",
-                    },
-                    "args": {
-                        "type": "array",
-                        "items": {},
-                        "description": "Positional arguments for the method",
-                        "default": [],
-                    },
-                    "kwargs": {
-                        "type": "object",
-                        "description": "Keyword arguments for the method",
-                        "default": {},
-                    },
-                },
-                "required": ["model", "method"],
-            },
-        ),
-        Tool(
-            name="odoo_fields_get",
-            description="Get field definitions for an Odoo model. "
-            "Useful for understanding model structure.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "server": _server_property(),
-                    "model": {
-                        "type": "string",
-                        "description": "Odoo model name",
-                    },
-                    "attributes": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Field attributes to return (e.g., ['string', 'type', 'required'])",
-                    },
-                },
-                "required": ["model"],
+def _model_property(description: str = "Odoo model name") -> dict:
+    """Return model property schema for tools."""
+    return {"type": "string", "description": description}
+
+
+def _domain_property(description: str = "Search domain as list of conditions") -> dict:
+    """Return domain property schema for tools."""
+    return {
+        "type": "array",
+        "items": {"type": "array", "items": {}},
+        "description": description,
+        "default": [],
+    }
+
+
+def _ids_property(description: str) -> dict:
+    """Return record IDs property schema for tools."""
+    return {
+        "type": "array",
+        "items": {"type": "integer"},
+        "description": description,
+    }
+
+
+# Errors worth retrying for read-only tools (network/transport, not Odoo faults)
+_TRANSIENT_ERRORS = (
+    OSError,
+    http.client.HTTPException,
+    xmlrpc.client.ProtocolError,
+    httpx.TransportError,
+)
+
+
+ToolHandler = Callable[[dict], Awaitable[Any]]
+
+
+@dataclass
+class ToolSpec:
+    """A registered tool: its MCP definition plus dispatch metadata.
+
+    Attributes:
+        name: Tool name exposed over MCP
+        handler: Coroutine function taking the arguments dict (defaults applied)
+        tool: MCP tool definition returned by list_tools
+        defaults: Default argument values taken from the schema
+        read_only: True if the tool never modifies Odoo data. Read-only
+            tools are retried on transient errors; mutating tools never are,
+            and invalidate cached data for their ``model`` argument.
+        validator: JSON schema validator for the arguments, compiled on
+            first dispatch so unused tools cost nothing at startup
+    """
+
+    name: str
+    handler: ToolHandler
+    tool: Tool
+    defaults: dict[str, Any]
+    read_only: bool
+    validator: Draft202012Validator | None = None
+
+    def validate(self, arguments: dict) -> None:
+        """Validate tool arguments against the schema.
+
+        Raises:
+            ValueError: If the arguments are invalid
+        """
+        if self.validator is None:
+            self.validator = Draft202012Validator(self.tool.inputSchema)
+        error = next(self.validator.iter_errors(arguments), None)
+        if error is not None:
+            raise ValueError(f"Input validation error: {error.message}")
+
+
+# Tool registry, in list_tools order
+_tool_registry: dict[str, ToolSpec] = {}
+
+
+def register_tool(
+    name: str,
+    description: str,
+    properties: dict[str, dict],
+    required: list[str] | None = None,
+    *,
+    read_only: bool,
+) -> Callable[[ToolHandler], ToolHandler]:
+    """Register a tool handler with its argument schema.
+
+    Defaults are collected once here and the validator is compiled on
+    first use and then reused, so dispatch never re-parses the schema.
+    Schemas themselves are meta-validated by benchmarks/bench_dispatch.py
+    rather than at import, to keep stdio startup fast.
+
+    Args:
+        name: Tool name
+        description: Tool description shown to the agent
+        properties: JSON schema properties for the tool arguments
+        required: Names of required arguments
+        read_only: Whether the tool only reads data. Required: read-only
+            tools are retried automatically, which is unsafe for writes.
+
+    Returns:
+        Decorator registering the handler
+    """
+    def decorator(handler: ToolHandler) -> ToolHandler:
+        if name in _tool_registry:
+            raise ValueError(f"Tool '{name}' is already registered")
+        schema: dict[str, Any] = {"type": "object", "properties": properties}
+        if required:
+            missing = [arg for arg in required if arg not in properties]
+            if missing:
+                raise ValueError(f"Tool '{name}' requires undeclared arguments: {missing}")
+            schema["required"] = required
+
+        _tool_registry[name] = ToolSpec(
+            name=name,
+            handler=handler,
+            tool=Tool(
+                name=name,
+                description=description,
+                inputSchema=schema,
+                annotations=ToolAnnotations(
+                    readOnlyHint=read_only,
+                    destructiveHint=not read_only,
+                ),
+            ),
+            defaults={
+                arg: prop["default"]
+                for arg, prop in properties.items()
+                if "default" in prop
             },
+            read_only=read_only,
+        )
+        return handler
+
+    return decorator
+
+
+@register_tool(
+    "odoo_list_servers",
+    "List all configured Odoo servers.",
+    {},
+    read_only=True,
+)
+async def _list_servers(arguments: dict) -> Any:
+    get_server_names()
+    servers_info = {}
+    for srv_name, config in _server_configs.items():
+        servers_info[srv_name] = {
+            "url": config["url"],
+            "db": config["db"],
+            "is_default": srv_name == _default_server,
+        }
+    return {
+        "servers": servers_info,
+        "default_server": _default_server,
+    }
+
+
+@register_tool(
+    "odoo_search_read",
+    "Search and read records from an Odoo model. "
+    "Returns records matching the search domain with specified fields.",
+    {
+        "server": _server_property(),
+        "model": _model_property("Odoo model name (e.g., 'res.partner', 'sale.order')"),
+        "domain": _domain_property(
+            "Search domain as list of conditions. "
+            "Example: [['is_company', '=', True], ['country_id.code', '=', 'TH']]"
         ),
-        Tool(
-            name="odoo_version",
-            description="Get Odoo server version information.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "server": _server_property(),
-                },
-            },
+        "fields": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of field names to return. Empty for all fields.",
+        },
+        "offset": {
+            "type": "integer",
+            "description": "Number of records to skip",
+            "default": 0,
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Maximum number of records to return",
+        },
+        "order": {
+            "type": "string",
+            "description": "Sort order (e.g., 'name asc, id desc')",
+        },
+    },
+    required=["model"],
+    read_only=True,
+)
+async def _search_read(arguments: dict) -> Any:
+    client = get_client(arguments.get("server"))
+    model = arguments["model"]
+
+    def fetch() -> Any:
+        return client.search_read(
+            model=model,
+            domain=arguments["domain"],
+            fields=arguments.get("fields"),
+            offset=arguments["offset"],
+            limit=arguments.get("limit"),
+            order=arguments.get("order"),
+        )
+
+    if _is_reference_model(model):
+        key = [
+            "search_read",
+            model,
+            arguments["domain"],
+            arguments.get("fields"),
+            arguments["offset"],
+            arguments.get("limit"),
+            arguments.get("order"),
+        ]
+        return await _cached(client, key, fetch, model=model)
+    return await _resolve(fetch())
+
+
+@register_tool(
+    "odoo_name_search",
+    "Find records by name (e.g., resolve 'Acme' to a partner ID). "
+    "Returns [id, display_name] pairs. Faster than odoo_search_read with 'ilike' "
+    "and served from a local index for configured models.",
+    {
+        "server": _server_property(),
+        "model": _model_property("Odoo model name (e.g., 'res.partner', 'product.product')"),
+        "name": {
+            "type": "string",
+            "description": "Text to match against the record name",
+            "default": "",
+        },
+        "domain": _domain_property("Additional search domain (bypasses the local index)"),
+        "operator": {
+            "type": "string",
+            "description": "Operator used to match the name (e.g., 'ilike', '=')",
+            "default": "ilike",
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Maximum number of records to return",
+            "default": 100,
+        },
+        "use_index": {
+            "type": "boolean",
+            "description": "Use the local name index when available",
+            "default": True,
+        },
+    },
+    required=["model"],
+    read_only=True,
+)
+async def _name_search(arguments: dict) -> Any:
+    client = get_client(arguments.get("server"))
+    model = arguments["model"]
+    if (
+        arguments["use_index"]
+        and not arguments["domain"]
+        and arguments["operator"] == "ilike"
+        and _name_index_enabled(model)
+    ):
+        index = await get_name_index(client, model)
+        return index.search(arguments["name"], arguments["limit"])
+    return await _resolve(
+        client.name_search(
+            model=model,
+            name=arguments["name"],
+            domain=arguments["domain"],
+            operator=arguments["operator"],
+            limit=arguments["limit"],
+        )
+    )
+
+
+@register_tool(
+    "odoo_search_count",
+    "Count records matching a search domain in an Odoo model.",
+    {
+        "server": _server_property(),
+        "model": _model_property(),
+        "domain": _domain_property(),
+    },
+    required=["model"],
+    read_only=True,
+)
+async def _search_count(arguments: dict) -> Any:
+    client = get_client(arguments.get("server"))
+    return await _resolve(
+        client.search_count(
+            model=arguments["model"],
+            domain=arguments["domain"],
+        )
+    )
+
+
+@register_tool(
+    "odoo_read",
+    "Read specific records by their IDs from an Odoo model.",
+    {
+        "server": _server_property(),
+        "model": _model_property(),
+        "ids": _ids_property("List of record IDs to read"),
+        "fields": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of field names to return",
+        },
+    },
+    required=["model", "ids"],
+    read_only=True,
+)
+async def _read(arguments: dict) -> Any:
+    client = get_client(arguments.get("server"))
+    model = arguments["model"]
+
+    def fetch() -> Any:
+        return client.read(
+            model=model,
+            ids=arguments["ids"],
+            fields=arguments.get("fields"),
+        )
+
+    if _is_reference_model(model):
+        key = ["read", model, arguments["ids"], arguments.get("fields")]
+        return await _cached(client, key, fetch, model=model)
+    return await _resolve(fetch())
+
+
+@register_tool(
+    "odoo_create",
+    "Create a new record in an Odoo model.",
+    {
+        "server": _server_property(),
+        "model": _model_property(),
+        "values": {
+            "type": "object",
+            "description": "Field values for the new record. "
+            "Example: {'name': 'New Partner', 'email': 'partner@example.com'}",
+        },
+    },
+    required=["model", "values"],
+    read_only=False,
+)
+async def _create(arguments: dict) -> Any:
+    client = get_client(arguments.get("server"))
+    record_id = await _resolve(
+        client.create(
+            model=arguments["model"],
+            values=arguments["values"],
+        )
+    )
+    return {"id": record_id, "message": f"Created record with ID {record_id}"}
+
+
+@register_tool(
+    "odoo_write",
+    "Update existing records in an Odoo model.",
+    {
+        "server": _server_property(),
+        "model": _model_property(),
+        "ids": _ids_property("List of record IDs to update"),
+        "values": {
+            "type": "object",
+            "description": "Field values to update",
+        },
+    },
+    required=["model", "ids", "values"],
+    read_only=False,
+)
+async def _write(arguments: dict) -> Any:
+    client = get_client(arguments.get("server"))
+    success = await _resolve(
+        client.write(
+            model=arguments["model"],
+            ids=arguments["ids"],
+            values=arguments["values"],
+        )
+    )
+    return {
+        "success": success,
+        "message": f"Updated {len(arguments['ids'])} record(s)",
+    }
+
+
+@register_tool(
+    "odoo_delete",
+    "Delete records from an Odoo model.",
+    {
+        "server": _server_property(),
+        "model": _model_property(),
+        "ids": _ids_property("List of record IDs to delete"),
+    },
+    required=["model", "ids"],
+    read_only=False,
+)
+async def _delete(arguments: dict) -> Any:
+    client = get_client(arguments.get("server"))
+    success = await _resolve(
+        client.unlink(
+            model=arguments["model"],
+            ids=arguments["ids"],
+        )
+    )
+    return {
+        "success": success,
+        "message": f"Deleted {len(arguments['ids'])} record(s)",
+    }
+
+
+@register_tool(
+    "odoo_execute",
+    "Execute any method on an Odoo model. "
+    "Use this for custom methods or operations not covered by other tools.",
+    {
+        "server": _server_property(),
+        "model": _model_property(),
+        "method": {
+            "type": "string",
+            "description": "Method name to call",
+        },
+        "args": {
+            "type": "array",
+            "items": {},
+            "description": "Positional arguments for the method",
+            "default": [],
+        },
+        "kwargs": {
+            "type": "object",
+            "description": "Keyword arguments for the method",
+            "default": {},
+        },
+    },
+    required=["model", "method"],
+    read_only=False,
+)
+async def _execute(arguments: dict) -> Any:
+    client = get_client(arguments.get("server"))
+    return await _resolve(
+        client.execute(
+            arguments["model"],
+            arguments["method"],
+            *arguments["args"],
+            **arguments["kwargs"],
+        )
+    )
+
+
+@register_tool(
+    "odoo_fields_get",
+    "Get field definitions for an Odoo model. "
+    "Useful for understanding model structure.",
+    {
+        "server": _server_property(),
+        "model": _model_property(),
+        "attributes": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Field attributes to return (e.g., ['string', 'type', 'required'])",
+        },
+    },
+    required=["model"],
+    read_only=True,
+)
+async def _fields_get(arguments: dict) -> Any:
+    client = get_client(arguments.get("server"))
+    model = arguments["model"]
+    return await _cached(
+        client,
+        ["fields_get", model, arguments.get("attributes")],
+        lambda: client.fields_get(
+            model=model,
+            attributes=arguments.get("attributes"),
         ),
-    ]
+        # Field definitions change when modules are installed or upgraded
+        fingerprint=lambda: _data_fingerprint(client, "ir.model.fields", [["model", "=", model]]),
+    )
+
+
+@register_tool(
+    "odoo_version",
+    "Get Odoo server version information.",
+    {
+        "server": _server_property(),
+    },
+    read_only=True,
+)
+async def _version(arguments: dict) -> Any:
+    client = get_client(arguments.get("server"))
+    return await _cached(client, ["version"], client.get_version)
+
+
+@register_tool(
+    "odoo_profile_report",
+    "Report the slowest Odoo queries made through this server, grouped by "
+    "model, method, domain shape and fields. Use it to find queries that need "
+    "an index or a narrower field list.",
+    {
+        "limit": {
+            "type": "integer",
+            "description": "Number of query groups to return",
+            "default": 10,
+        },
+        "sort_by": {
+            "type": "string",
+            "enum": ["total", "max", "count"],
+            "description": "Rank by summed time, worst single call, or number of slow calls",
+            "default": "total",
+        },
+        "reset": {
+            "type": "boolean",
+            "description": "Clear the slow-call log (and ODOO_SLOW_LOG_FILE) after reporting",
+            "default": False,
+        },
+    },
+    read_only=True,
+)
+async def _profile_report(arguments: dict) -> Any:
+    slow_log = get_slow_log()
+    report = slow_log.report(limit=arguments["limit"], sort_by=arguments["sort_by"])
+    if arguments["reset"]:
+        slow_log.clear()
+    return report
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available Odoo tools."""
+    global _tools
+
+    if _tools is None:
+        _tools = [spec.tool for spec in _tool_registry.values()]
+    return _tools
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+async def dispatch_tool(name: str, arguments: dict) -> Any:
+    """Validate arguments and run the registered handler for a tool.
+
+    Args:
+        name: Tool name
+        arguments: Tool arguments as sent by the client
+
+    Returns:
+        Handler result (before formatting)
+
+    Raises:
+        ValueError: If the tool is unknown or the arguments are invalid
+    """
+    spec = _tool_registry.get(name)
+    if spec is None:
+        raise ValueError(f"Unknown tool: {name}")
+
+    spec.validate(arguments)
+
+    if spec.defaults:
+        arguments = {**spec.defaults, **arguments}
+
+    if not spec.read_only:
+        try:
+            return await spec.handler(arguments)
+        finally:
+            # Even a failed or timed-out call may have changed data in Odoo
+            if "model" in arguments:
+                _invalidate_after_write(name, arguments)
+    try:
+        return await spec.handler(arguments)
+    except _TRANSIENT_ERRORS:
+        # Safe to retry once: read-only tools have no side effects
+        return await spec.handler(arguments)
+
+
+@server.call_tool(validate_input=False)
+async def call_tool(name: str, arguments: dict) -> list[TextContent | ResourceLink]:
     """Handle tool calls."""
+    if name not in _tool_registry:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    calls = []
+    format_seconds = 0.0
+    size = None
     try:
-        # Get server name from arguments (optional)
-        server_name = arguments.get("server")
-        result: Any = None
-
-        if name == "odoo_list_servers":
-            if not _server_configs:
-                load_server_configs()
-            servers_info = {}
-            for srv_name, config in _server_configs.items():
-                servers_info[srv_name] = {
-                    "url": config["url"],
-                    "db": config["db"],
-                    "is_default": srv_name == _default_server,
-                }
-            result = {
-                "servers": servers_info,
-                "default_server": _default_server,
-            }
-
-        elif name == "odoo_search_read":
-            client = get_client(server_name)
-            result = client.search_read(
-                model=arguments["model"],
-                domain=arguments.get("domain", []),
-                fields=arguments.get("fields"),
-                offset=arguments.get("offset", 0),
-                limit=arguments.get("limit"),
-                order=arguments.get("order"),
-            )
+        with collect_calls() as calls:
+            result = await dispatch_tool(name, arguments or {})
 
-        elif name == "odoo_search_count":
-            client = get_client(server_name)
-            result = client.search_count(
-                model=arguments["model"],
-                domain=arguments.get("domain", []),
-            )
+        start = time.perf_counter()
+        content = _format_content(name, result)
+        format_seconds = time.perf_counter() - start
+        size = sum(
+            len(item.text) if isinstance(item, TextContent) else item.size or 0
+            for item in content
+        )
+    except Exception as e:
+        content = [TextContent(type="text", text=f"Error: {str(e)}")]
+    finally:
+        # Also log calls of cancelled tool calls; profiling must never fail the tool call
+        try:
+            get_slow_log().finish(calls, name, format_seconds, size)
+        except Exception:
+            logger.exception("Slow-call logging failed for %s", name)
+    return content
 
-        elif name == "odoo_read":
-            client = get_client(server_name)
-            result = client.read(
-                model=arguments["model"],
-                ids=arguments["ids"],
-                fields=arguments.get("fields"),
-            )
 
-        elif name == "odoo_create":
-            client = get_client(server_name)
-            record_id = client.create(
-                model=arguments["model"],
-                values=arguments["values"],
-            )
-            result = {"id": record_id, "message": f"Created record with ID {record_id}"}
-
-        elif name == "odoo_write":
-            client = get_client(server_name)
-            success = client.write(
-                model=arguments["model"],
-                ids=arguments["ids"],
-                values=arguments["values"],
-            )
-            result = {
-                "success": success,
-                "message": f"Updated {len(arguments['ids'])} record(s)",
-            }
-
-        elif name == "odoo_delete":
-            client = get_client(server_name)
-            success = client.unlink(
-                model=arguments["model"],
-                ids=arguments["ids"],
-            )
-            result = {
-                "success": success,
-                "message": f"Deleted {len(arguments['ids'])} record(s)",
-            }
-
-        elif name == "odoo_execute":
-            client = get_client(server_name)
-            args = arguments.get("args", [])
-            kwargs = arguments.get("kwargs", {})
-            result = client.execute(
-                arguments["model"],
-                arguments["method"],
-                *args,
-                **kwargs,
-            )
+def _format_content(name: str, result: Any) -> list[TextContent | ResourceLink]:
+    """Build tool output, spooling large record lists to disk."""
+    spool = get_spool()
+    if spool is not None and isinstance(result, list):
+        try:
+            entry = spool.spill(result, name)
+        except OSError:
+            # Spool directory unusable: fall back to returning the result inline
+            entry = None
+        if entry is not None:
+            return [
+                ResourceLink(
+                    type="resource_link",
+                    name=entry.id,
+                    uri=AnyUrl(entry.uri),
+                    description=f"{entry.rows} record(s) from {name}",
+                    mimeType=NDJSON_MIME_TYPE,
+                    size=entry.bytes,
+                ),
+                TextContent(
+                    type="text",
+                    text=format_result(entry.summary(spool.chunk_rows)),
+                ),
+            ]
 
-        elif name == "odoo_fields_get":
-            client = get_client(server_name)
-            result = client.fields_get(
-                model=arguments["model"],
-                attributes=arguments.get("attributes"),
-            )
+    return [TextContent(type="text", text=format_result(result))]
 
-        elif name == "odoo_version":
-            client = get_client(server_name)
-            result = client.get_version()
 
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+@server.list_resources()
+async def list_resources() -> list[Resource]:
+    """List spooled results that have not expired."""
+    spool = get_spool()
+    if spool is None:
+        return []
+    return [
+        Resource(
+            name=entry.id,
+            uri=AnyUrl(entry.uri),
+            description=f"{entry.rows} record(s) from {entry.tool}",
+            mimeType=NDJSON_MIME_TYPE,
+            size=entry.bytes,
+        )
+        for entry in spool.entries()
+    ]
 
-        return [TextContent(type="text", text=format_result(result))]
 
-    except Exception as e:
-        return [TextContent(type="text", text=f"Error: {str(e)}")]
+@server.read_resource()
+async def read_resource(uri: AnyUrl) -> list[ReadResourceContents]:
+    """Read a chunk of a spooled result.
+
+    URIs take optional ``offset`` and ``limit`` row parameters, e.g.
+    ``odoo-spool://<id>?offset=1000&limit=1000``.
+    """
+    spool = get_spool()
+    if spool is None:
+        raise ValueError(f"Unknown resource: {uri}")
+    return [ReadResourceContents(content=spool.read_uri(str(uri)), mime_type=NDJSON_MIME_TYPE)]
 
 
 async def run_stdio_server():
     """Run the MCP server with stdio transport."""
+    global _disk_cache_enabled
+
+    from mcp.server.stdio import stdio_server
+
+    # Each stdio session is a fresh process: start warm from the disk cache
+    _disk_cache_enabled = True
+
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,
@@ -476,6 +1341,8 @@ async def run_stdio_server():
 
 async def run_streamable_http_server(host: str, port: int):
     """Run the MCP server with Streamable HTTP transport."""
+    global _use_async_client
+
     import contextlib
     from collections.abc import AsyncIterator
 
@@ -486,6 +1353,8 @@ async def run_streamable_http_server(host: str, port: int):
     from starlette.routing import Mount, Route
     import uvicorn
 
+    # Many concurrent sessions: share one event loop instead of blocking it
+    _use_async_client = True
     session_manager = StreamableHTTPSessionManager(app=server)
 
     async def handle_streamable_http(scope, receive, send):
@@ -497,7 +1366,10 @@ async def run_streamable_http_server(host: str, port: int):
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
         async with session_manager.run():
-            yield
+            try:
+                yield
+            finally:
+                await close_clients()
 
     starlette_app = Starlette(
         debug=False,
@@ -515,8 +1387,6 @@ async def run_streamable_http_server(host: str, port: int):
 
 def main():
     """Main entry point."""
-    import asyncio
-
     parser = argparse.ArgumentParser(description="Odoo MCP Server")
     parser.add_argument(
         "--http",
@@ -0,0 +1,284 @@
+"""Spool large tool results to disk as NDJSON and serve them back in chunks."""
+
+import itertools
+import json
+import os
+import re
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+SPOOL_SCHEME = "odoo-spool"
+NDJSON_MIME_TYPE = "application/x-ndjson"
+
+# Record a byte offset every this many rows so chunked reads can seek
+_INDEX_STRIDE = 1000
+
+_SPOOL_ID_RE = re.compile(r"[0-9a-f]{32}")
+
+
+@dataclass
+class SpoolEntry:
+    """Metadata for one spooled result.
+
+    Attributes:
+        id: Spool entry ID (also the resource URI host)
+        tool: Name of the tool that produced the result
+        rows: Number of records
+        bytes: Size of the NDJSON file
+        fields: Field names of the first record
+        id_min: Smallest record 'id', if records have one
+        id_max: Largest record 'id', if records have one
+        created_at: Unix timestamp of creation
+        expires_at: Unix timestamp after which the entry is deleted
+        offsets: Byte offset of every ``_INDEX_STRIDE``-th row
+    """
+
+    id: str
+    tool: str
+    rows: int
+    bytes: int
+    fields: list[str]
+    id_min: int | None
+    id_max: int | None
+    created_at: float
+    expires_at: float
+    offsets: list[int] = field(default_factory=list, repr=False)
+
+    @property
+    def uri(self) -> str:
+        """Resource URI for this entry."""
+        return f"{SPOOL_SCHEME}://{self.id}"
+
+    def summary(self, chunk_rows: int) -> dict:
+        """Summary stats returned to the agent in place of the records."""
+        return {
+            "spooled": True,
+            "uri": self.uri,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "fields": self.fields,
+            "id_min": self.id_min,
+            "id_max": self.id_max,
+            "expires_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.expires_at)),
+            "message": f"Result too large to return inline; {self.rows} record(s) written as NDJSON. "
+            f"Read it in chunks with resource URI '{self.uri}?offset=0&limit={chunk_rows}'.",
+        }
+
+
+class ResultSpool:
+    """On-disk spool for results too large to send inline."""
+
+    def __init__(
+        self,
+        directory: Path,
+        threshold: int,
+        ttl: float,
+        chunk_rows: int = 1000,
+    ):
+        """Initialize spool.
+
+        Args:
+            directory: Directory for spooled files (created on first spill)
+            threshold: Size in bytes above which results are spooled
+            ttl: Seconds to keep spooled results before deleting them
+            chunk_rows: Default number of rows per chunked read
+        """
+        self.directory = directory
+        self.threshold = threshold
+        self.ttl = ttl
+        self.chunk_rows = chunk_rows
+
+    def _data_path(self, spool_id: str) -> Path:
+        return self.directory / f"{spool_id}.ndjson"
+
+    def _meta_path(self, spool_id: str) -> Path:
+        return self.directory / f"{spool_id}.json"
+
+    def spill(self, records: list, tool: str) -> SpoolEntry | None:
+        """Write records as NDJSON if they serialize to more than the threshold.
+
+        Lines are buffered in memory only up to the threshold; past that they
+        are streamed straight to the file.
+
+        Args:
+            records: Records to spool
+            tool: Name of the tool that produced them
+
+        Returns:
+            The new SpoolEntry, or None if the records are small enough to inline
+        """
+        buffered: list[bytes] = []
+        size = 0
+        index = 0
+        for index, record in enumerate(records):
+            line = _dumps_line(record)
+            buffered.append(line)
+            size += len(line)
+            if size > self.threshold:
+                break
+        else:
+            return None
+
+        self._ensure_directory()
+        self.cleanup()
+
+        spool_id = uuid.uuid4().hex
+        data_path = self._data_path(spool_id)
+        tmp_path = data_path.with_suffix(".tmp")
+        offsets: list[int] = []
+        id_min: int | None = None
+        id_max: int | None = None
+        written = 0
+
+        with _open_private(tmp_path, "wb") as f:
+            lines = (_dumps_line(record) for record in itertools.islice(records, index + 1, None))
+            for row, (record, line) in enumerate(zip(records, itertools.chain(buffered, lines))):
+                if row % _INDEX_STRIDE == 0:
+                    offsets.append(written)
+                record_id = record.get("id") if isinstance(record, dict) else None
+                if isinstance(record_id, int):
+                    id_min = record_id if id_min is None else min(id_min, record_id)
+                    id_max = record_id if id_max is None else max(id_max, record_id)
+                f.write(line)
+                written += len(line)
+        os.replace(tmp_path, data_path)
+
+        first = records[0]
+        now = time.time()
+        entry = SpoolEntry(
+            id=spool_id,
+            tool=tool,
+            rows=len(records),
+            bytes=written,
+            fields=list(first.keys()) if isinstance(first, dict) else [],
+            id_min=id_min,
+            id_max=id_max,
+            created_at=now,
+            expires_at=now + self.ttl,
+            offsets=offsets,
+        )
+        with _open_private(self._meta_path(spool_id), "w") as f:
+            json.dump(asdict(entry), f)
+        return entry
+
+    def _ensure_directory(self) -> None:
+        """Create the spool directory private to the current user.
+
+        Raises:
+            PermissionError: If the directory exists but belongs to another user
+        """
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        stat = self.directory.stat()
+        if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+            raise PermissionError(f"Spool directory {self.directory} is owned by another user")
+        if stat.st_mode & 0o077:
+            self.directory.chmod(0o700)
+
+    def get(self, spool_id: str) -> SpoolEntry:
+        """Load an entry's metadata.
+
+        Raises:
+            ValueError: If the entry does not exist or has expired
+        """
+        if not _SPOOL_ID_RE.fullmatch(spool_id):
+            raise ValueError(f"Invalid spool ID: {spool_id}")
+        try:
+            with open(self._meta_path(spool_id)) as f:
+                entry = SpoolEntry(**json.load(f))
+        except FileNotFoundError:
+            raise ValueError(f"Spooled result '{spool_id}' not found or expired") from None
+        if entry.expires_at < time.time():
+            self._delete(spool_id)
+            raise ValueError(f"Spooled result '{spool_id}' not found or expired")
+        return entry
+
+    def read_chunk(self, spool_id: str, offset: int = 0, limit: int | None = None) -> str:
+        """Read a range of rows from a spooled result.
+
+        Args:
+            spool_id: Spool entry ID
+            offset: Index of the first row to return
+            limit: Maximum number of rows (defaults to ``chunk_rows``)
+
+        Returns:
+            NDJSON text for the requested rows
+        """
+        entry = self.get(spool_id)
+        limit = self.chunk_rows if limit is None else limit
+        if offset < 0 or limit < 0:
+            raise ValueError("offset and limit must be non-negative")
+        if offset >= entry.rows or limit == 0:
+            return ""
+
+        checkpoint = offset // _INDEX_STRIDE
+        lines: list[str] = []
+        with open(self._data_path(spool_id), "rb") as f:
+            f.seek(entry.offsets[checkpoint])
+            for _ in range(offset - checkpoint * _INDEX_STRIDE):
+                f.readline()
+            for _ in range(min(limit, entry.rows - offset)):
+                lines.append(f.readline().decode("utf-8"))
+        return "".join(lines)
+
+    def read_uri(self, uri: str) -> str:
+        """Read a chunk addressed by a ``odoo-spool://<id>?offset=&limit=`` URI."""
+        parts = urlsplit(uri)
+        if parts.scheme != SPOOL_SCHEME:
+            raise ValueError(f"Unknown resource: {uri}")
+        query = parse_qs(parts.query)
+        offset = int(query.get("offset", ["0"])[0])
+        limit = int(query["limit"][0]) if "limit" in query else None
+        return self.read_chunk(parts.netloc, offset, limit)
+
+    def entries(self) -> list[SpoolEntry]:
+        """List unexpired spooled results."""
+        self.cleanup()
+        if not self.directory.is_dir():
+            return []
+        result = []
+        for meta_path in self.directory.glob("*.json"):
+            try:
+                result.append(self.get(meta_path.stem))
+            except (ValueError, TypeError):
+                continue
+        return result
+
+    def cleanup(self) -> int:
+        """Delete spooled files older than the TTL.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.directory.is_dir():
+            return 0
+        cutoff = time.time() - self.ttl
+        removed = 0
+        for path in self.directory.iterdir():
+            if path.suffix not in (".json", ".ndjson", ".tmp"):
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += path.suffix == ".json"
+            except FileNotFoundError:
+                continue
+        return removed
+
+    def _delete(self, spool_id: str) -> None:
+        for path in (self._data_path(spool_id), self._meta_path(spool_id)):
+            path.unlink(missing_ok=True)
+
+
+def _open_private(path: Path, mode: str):
+    """Create a new file readable and writable only by the current user."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    return os.fdopen(fd, mode)
+
+
+def _dumps_line(record: Any) -> bytes:
+    """Serialize one record as an NDJSON line."""
+    return (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")